@@ -4,16 +4,88 @@ Ermöglicht deklarative Definition von UI-Elementen in Python
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Literal, Callable, List, Any, Tuple, Union
+from typing import Optional, Literal, Callable, List, Dict, Any, Tuple, Union
 from datetime import date
 from enum import Enum
-from functools import wraps
+from functools import lru_cache
+from operator import itemgetter
+import bisect
+import re
+import sys
+from collections import deque
+from collections.abc import Mapping
 
 
 # ============================================================
 # UI FIELD METADATA
 # ============================================================
 
+# Keys der Metadaten (reine Daten, Reihenfolge wie im bisherigen dict)
+_UI_DATA_KEYS = (
+    'ui_label', 'ui_type', 'ui_required', 'ui_hint', 'ui_placeholder',
+    'ui_group', 'ui_order', 'ui_validation', 'ui_min', 'ui_max',
+    'ui_depends_on', 'ui_show_when', 'ui_options',
+    'ui_width', 'ui_class'
+)
+
+
+class UIFieldMeta(Mapping):
+    """
+    UI-Metadaten eines Dataclass-Feldes
+    
+    Speichert die Werte in Slots statt in einem dict, verhält sich aber als
+    read-only Mapping mit den bekannten Keys ('ui_label', 'ui_type', ...),
+    damit field(metadata=...) und bestehende Konsumenten unverändert
+    funktionieren. Nicht gesetzte (None) Werte sind nicht enthalten.
+    Abgeleitete Laufzeitobjekte gehören nicht zum Mapping.
+    """
+    __slots__ = _UI_DATA_KEYS
+    
+    def __init__(self, **values):
+        for key, value in values.items():
+            if value is not None:
+                setattr(self, key, value)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _UI_META_KEYS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Wie dict.get, ohne Umweg über KeyError"""
+        if key in _UI_META_KEYS:
+            return getattr(self, key, default)
+        return default
+    
+    def __contains__(self, key: object) -> bool:
+        return key in _UI_META_KEYS and hasattr(self, key)
+    
+    def __iter__(self):
+        return (key for key in _UI_DATA_KEYS if hasattr(self, key))
+    
+    def __len__(self) -> int:
+        return sum(1 for key in _UI_DATA_KEYS if hasattr(self, key))
+    
+    def __repr__(self) -> str:
+        return f"UIFieldMeta({self.to_dict()!r})"
+    
+    @property
+    def validation_fns(self) -> tuple:
+        """Validatoren zu ui_validation (pro Regelkombination einmal aufgelöst)"""
+        rules = getattr(self, 'ui_validation', None)
+        return _resolve_validators(tuple(rules)) if rules else ()
+    
+    def to_dict(self) -> dict:
+        """Gibt die gesetzten Metadaten als dict zurück (für Serialisierung)"""
+        return {key: getattr(self, key) for key in self}
+
+
+_UI_META_KEYS = frozenset(_UI_DATA_KEYS)
+
+
 def ui_field(
     label: str = None,
     typ: Literal["text", "number", "date", "select", "checkbox"] = None,
@@ -34,7 +106,7 @@ def ui_field(
     # Styling
     width: Literal["full", "half", "third"] = "full",
     css_class: str = None
-) -> dict:
+) -> UIFieldMeta:
     """
     Factory für UI-Metadaten an Dataclass Fields
     
@@ -56,7 +128,7 @@ def ui_field(
         css_class: Zusätzliche CSS-Klassen
     
     Returns:
-        Dictionary mit UI-Metadaten
+        UIFieldMeta (read-only Mapping mit UI-Metadaten)
     
     Example:
         >>> @dataclass
@@ -67,32 +139,28 @@ def ui_field(
         >>>         required=True
         >>>     ))
     """
-    metadata = {}
-    
-    if label is not None: metadata['ui_label'] = label
-    if typ is not None: metadata['ui_type'] = typ
-    if required is not None: metadata['ui_required'] = required
-    if hint is not None: metadata['ui_hint'] = hint
-    if placeholder is not None: metadata['ui_placeholder'] = placeholder
-    if group is not None: metadata['ui_group'] = group
-    if order is not None: metadata['ui_order'] = order
-    
-    # Validation
-    if validation is not None:
-        metadata['ui_validation'] = validation if isinstance(validation, list) else [validation]
-    if min_value is not None: metadata['ui_min'] = min_value
-    if max_value is not None: metadata['ui_max'] = max_value
-    
-    # Conditional Logic
-    if depends_on is not None: metadata['ui_depends_on'] = depends_on
-    if show_when is not None: metadata['ui_show_when'] = show_when
-    
-    # Options
-    if options is not None: metadata['ui_options'] = options
-    
-    # Styling
-    if width is not None: metadata['ui_width'] = width
-    if css_class is not None: metadata['ui_class'] = css_class
+    # None-Werte werden von UIFieldMeta nicht gesetzt
+    metadata = UIFieldMeta(
+        ui_label=label,
+        ui_type=typ,
+        ui_required=required,
+        ui_hint=hint,
+        ui_placeholder=placeholder,
+        ui_group=None if group is None else sys.intern(group),
+        ui_order=order,
+        # Validation
+        ui_validation=validation if isinstance(validation, list) or validation is None else [validation],
+        ui_min=min_value,
+        ui_max=max_value,
+        # Conditional Logic
+        ui_depends_on=None if depends_on is None else sys.intern(depends_on),
+        ui_show_when=show_when,
+        # Options
+        ui_options=options,
+        # Styling
+        ui_width=width,
+        ui_class=css_class
+    )
     
     return metadata
 
@@ -101,29 +169,141 @@ def ui_field(
 # CALCULATED FIELD REGISTRY & DECORATOR
 # ============================================================
 
-class CalculatedFieldRegistry:
-    """Globale Registry für alle berechneten Felder"""
-    _fields = {}
+@dataclass(slots=True, frozen=True)
+class CalcFieldSpec:
+    """Metadaten eines berechneten Feldes"""
+    key: str
+    label: str
+    formel: str
+    requires: Tuple[str, ...]
+    einheit: str
+    editable: bool
+    needs_confirmation: bool
+    confirmation_threshold: int
+    group: str
+    hint: Optional[str]
+    precision: int
+    function: Callable
+    function_name: str
+
+
+# Registry-Zustand als Modul-Globals (kein Descriptor-Lookup pro Aufruf)
+_CALC_FIELDS: Dict[str, CalcFieldSpec] = {}
+
+# Parallele Listen für Bulk-Iteration (Abhängigkeitsauflösung)
+_CALC_KEYS: List[str] = []
+_CALC_REQUIRES: List[Tuple[str, ...]] = []
+
+# Reverse-Index: Input-Feld → Keys der Felder, die es benötigen
+_CALC_DEPENDENTS: Dict[str, List[str]] = {}
+
+# Topologische Ausführungsreihenfolge (lazy, None = neu berechnen)
+_calc_exec_order: Optional[Tuple[CalcFieldSpec, ...]] = None
+# Wird bei jeder Änderung hochgezählt (für Caches von Konsumenten)
+_calc_version = 0
+
+
+def register_calc(spec: CalcFieldSpec):
+    """Registriert ein berechnetes Feld"""
+    global _calc_exec_order, _calc_version
     
-    @classmethod
-    def register(cls, metadata):
-        """Registriert ein berechnetes Feld"""
-        cls._fields[metadata['key']] = metadata
+    if spec.key in _CALC_FIELDS:
+        idx = _CALC_KEYS.index(spec.key)
+        for r in _CALC_REQUIRES[idx]:
+            _CALC_DEPENDENTS[r].remove(spec.key)
+        _CALC_REQUIRES[idx] = spec.requires
+    else:
+        _CALC_KEYS.append(spec.key)
+        _CALC_REQUIRES.append(spec.requires)
+    _CALC_FIELDS[spec.key] = spec
     
-    @classmethod
-    def get_all(cls):
-        """Gibt alle registrierten Felder zurück"""
-        return cls._fields
+    for r in spec.requires:
+        _CALC_DEPENDENTS.setdefault(r, []).append(spec.key)
     
-    @classmethod
-    def get(cls, key: str):
-        """Gibt ein spezifisches Feld zurück"""
-        return cls._fields.get(key)
+    _calc_exec_order = None
+    _calc_version += 1
+
+
+def get_all_calcs() -> Dict[str, CalcFieldSpec]:
+    """Gibt alle registrierten Felder zurück"""
+    return _CALC_FIELDS
+
+
+def get_calc(key: str) -> Optional[CalcFieldSpec]:
+    """Gibt ein spezifisches Feld zurück"""
+    return _CALC_FIELDS.get(key)
+
+
+def calc_version() -> int:
+    """Änderungszähler der Registry"""
+    return _calc_version
+
+
+def get_calc_dependents(field_name: str) -> List[str]:
+    """Gibt die Keys aller Felder zurück, die field_name benötigen"""
+    return _CALC_DEPENDENTS.get(field_name, [])
+
+
+def calc_exec_order() -> Tuple[CalcFieldSpec, ...]:
+    """
+    Gibt alle Felder in Ausführungsreihenfolge zurück
+    
+    Felder, die das Ergebnis eines anderen berechneten Feldes benötigen,
+    kommen nach diesem (Kahn-Algorithmus). Reine Input-Felder in requires
+    werden ignoriert. Das Ergebnis wird bis zum nächsten register/clear
+    gecacht.
+    
+    Raises:
+        ValueError: Bei zyklischen Abhängigkeiten
+    """
+    global _calc_exec_order
+    
+    if _calc_exec_order is not None:
+        return _calc_exec_order
+    
+    in_degree = {}
+    for key, requires in zip(_CALC_KEYS, _CALC_REQUIRES):
+        in_degree[key] = sum(1 for r in requires if r in _CALC_FIELDS)
     
-    @classmethod
-    def clear(cls):
-        """Löscht alle registrierten Felder (für Tests)"""
-        cls._fields = {}
+    queue = deque(key for key in _CALC_KEYS if in_degree[key] == 0)
+    order = []
+    while queue:
+        key = queue.popleft()
+        order.append(_CALC_FIELDS[key])
+        for dependent in _CALC_DEPENDENTS.get(key, []):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+    
+    if len(order) != len(_CALC_KEYS):
+        zyklus = [key for key, grad in in_degree.items() if grad > 0]
+        raise ValueError(f"Zyklische Abhängigkeit zwischen berechneten Feldern: {zyklus}")
+    
+    _calc_exec_order = tuple(order)
+    return _calc_exec_order
+
+
+def clear_calcs():
+    """Löscht alle registrierten Felder (für Tests)"""
+    global _calc_exec_order, _calc_version
+    
+    _CALC_FIELDS.clear()
+    _CALC_KEYS.clear()
+    _CALC_REQUIRES.clear()
+    _CALC_DEPENDENTS.clear()
+    _calc_exec_order = None
+    _calc_version += 1
+
+
+class CalculatedFieldRegistry:
+    """Globale Registry für alle berechneten Felder (Namespace, kompatible API)"""
+    register = staticmethod(register_calc)
+    get_all = staticmethod(get_all_calcs)
+    get = staticmethod(get_calc)
+    get_dependents = staticmethod(get_calc_dependents)
+    exec_order = staticmethod(calc_exec_order)
+    version = staticmethod(calc_version)
+    clear = staticmethod(clear_calcs)
 
 
 def calculated_field(
@@ -156,7 +336,7 @@ def calculated_field(
         precision: Dezimalstellen für Zahlen
     
     Returns:
-        Decorated function
+        Die unveränderte Funktion (Metadaten unter func._calculation_metadata)
     
     Example:
         >>> @calculated_field(
@@ -172,33 +352,29 @@ def calculated_field(
     """
     def decorator(func: Callable):
         # Erstelle Metadata
-        metadata = {
-            'key': key,
-            'label': label,
-            'formel': formel,
-            'requires': requires,
-            'einheit': einheit,
-            'editable': editable,
-            'needs_confirmation': needs_confirmation,
-            'confirmation_threshold': confirmation_threshold,
-            'group': group,
-            'hint': hint,
-            'precision': precision,
-            'function': func,
-            'function_name': func.__name__
-        }
+        spec = CalcFieldSpec(
+            key=sys.intern(key),
+            label=label,
+            formel=formel,
+            requires=tuple(sys.intern(r) for r in requires),
+            einheit=einheit,
+            editable=editable,
+            needs_confirmation=needs_confirmation,
+            confirmation_threshold=confirmation_threshold,
+            group=group,
+            hint=hint,
+            precision=precision,
+            function=func,
+            function_name=func.__name__
+        )
         
         # Registriere in globaler Registry
-        CalculatedFieldRegistry.register(metadata)
+        register_calc(spec)
         
         # Attach metadata to function
-        func._calculation_metadata = metadata
-        
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+        func._calculation_metadata = spec
         
-        return wrapper
+        return func
     
     return decorator
 
@@ -225,83 +401,222 @@ class ValidationRule(Enum):
     GEHALT_BEI_NEU_REGELUNG = "gehalt_bei_neu_regelung"
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso(s: str) -> date:
+    """Parst ein ISO-Datum (gecacht, Formulardaten wiederholen sich)"""
+    return date.fromisoformat(s)
+
+
+# Format von Datums-Strings im Formular (YYYY-MM-DD)
+_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+# Kontextfelder, die von Regeln als Datum gelesen werden
+_DATE_CONTEXT_KEYS = ('eintrittsdatum',)
+
+
+def _normalize_context(context: dict) -> dict:
+    """Wandelt Datums-Strings im Kontext einmalig in date-Objekte um"""
+    normalized = dict(context)
+    for key in _DATE_CONTEXT_KEYS:
+        value = normalized.get(key)
+        if isinstance(value, str) and _ISO_RE.fullmatch(value):
+            try:
+                normalized[key] = _parse_iso(value)
+            except ValueError:
+                pass  # Regel meldet "Ungültiges Datum"
+    return normalized
+
+
+def _build_rules() -> dict:
+    """Erzeugt die Regel-Closures einmalig beim Import"""
+    parse_iso = _parse_iso
+    iso_match = _ISO_RE.fullmatch
+    today = date.today
+    
+    def _v_required(value: Any, context: Optional[dict], now: Optional[date] = None) -> Tuple[bool, str]:
+        valid = value is not None and value != ""
+        return (valid, "Dieses Feld ist erforderlich" if not valid else "")
+    
+    def _v_date_in_past(value: Any, context: Optional[dict], now: Optional[date] = None) -> Tuple[bool, str]:
+        if not value:
+            return (True, "")
+        # Offensichtlich ungültige Strings ohne Exception abweisen
+        if isinstance(value, str) and not iso_match(value):
+            return (False, "Ungültiges Datum")
+        try:
+            d = parse_iso(value) if isinstance(value, str) else value
+            valid = d < (now or today())
+            return (valid, "Datum muss in der Vergangenheit liegen" if not valid else "")
+        except (ValueError, TypeError):
+            return (False, "Ungültiges Datum")
+    
+    def _v_date_after_eintrittsdatum(value: Any, context: Optional[dict], now: Optional[date] = None) -> Tuple[bool, str]:
+        if not value or context is None or 'eintrittsdatum' not in context:
+            return (True, "")
+        eintritt = context['eintrittsdatum']
+        if (isinstance(value, str) and not iso_match(value)) or \
+           (isinstance(eintritt, str) and not iso_match(eintritt)):
+            return (False, "Ungültiges Datum")
+        try:
+            d = parse_iso(value) if isinstance(value, str) else value
+            eintritt = parse_iso(eintritt) if isinstance(eintritt, str) else eintritt
+            valid = d >= eintritt
+            return (valid, "Austrittsdatum muss nach Eintrittsdatum liegen" if not valid else "")
+        except (ValueError, TypeError):
+            return (False, "Ungültiges Datum")
+    
+    def _v_positive(value: Any, context: Optional[dict], now: Optional[date] = None) -> Tuple[bool, str]:
+        if isinstance(value, (int, float)):
+            valid = value > 0
+            return (valid, "Wert muss positiv sein" if not valid else "")
+        try:
+            valid = float(value) > 0
+            return (valid, "Wert muss positiv sein" if not valid else "")
+        except (ValueError, TypeError):
+            return (False, "Ungültige Zahl")
+    
+    return {
+        ValidationRule.REQUIRED: _v_required,
+        ValidationRule.DATE_PAST: _v_date_in_past,
+        ValidationRule.DATE_AFTER_EINTRITTSDATUM: _v_date_after_eintrittsdatum,
+        ValidationRule.POSITIVE: _v_positive,
+    }
+
+
+# ValidationRule → Validator(value, context | None, now=None) -> (is_valid, error_message)
+_RULES = _build_rules()
+
+# Regelname (String) → ValidationRule
+_RULE_BY_VALUE = ValidationRule._value2member_map_
+
+
+@lru_cache(maxsize=None)
+def _resolve_validators(rules: tuple) -> tuple:
+    """Regelnamen/-enums zu Validatoren auflösen (unbekannte Regeln entfallen)"""
+    return tuple(
+        fn for fn in (
+            _RULES.get(_RULE_BY_VALUE.get(r, r) if isinstance(r, str) else r)
+            for r in rules
+        )
+        if fn is not None
+    )
+
+
 class ValidationRuleImpl:
     """Implementierung der Validierungsregeln"""
     
     @staticmethod
-    def validate(rule: str, value: Any, context: dict = None) -> Tuple[bool, str]:
+    def validate(
+        rule: Union[ValidationRule, str],
+        value: Any,
+        context: dict = None,
+        now: date = None
+    ) -> Tuple[bool, str]:
         """
         Validiert einen Wert gegen eine Regel
         
         Args:
-            rule: Regelname
+            rule: ValidationRule oder Regelname
             value: Zu validierender Wert
             context: Kontext-Daten (andere Felder)
+            now: Referenzdatum für Datumsregeln (default: date.today())
         
         Returns:
             (is_valid, error_message)
         """
-        context = context or {}
+        if isinstance(rule, str):
+            rule = _RULE_BY_VALUE.get(rule, rule)
+        fn = _RULES.get(rule)
         
-        if rule == "required":
-            valid = value is not None and value != ""
-            return (valid, "Dieses Feld ist erforderlich" if not valid else "")
+        # Default: Regel nicht bekannt
+        if fn is None:
+            return (True, "")
         
-        if rule == "date_in_past":
-            if not value:
-                return (True, "")
-            try:
-                d = date.fromisoformat(value) if isinstance(value, str) else value
-                valid = d < date.today()
-                return (valid, "Datum muss in der Vergangenheit liegen" if not valid else "")
-            except:
-                return (False, "Ungültiges Datum")
+        # Kontext wird nur von Regeln gelesen, die ihn brauchen (kann None sein)
+        return fn(value, context, now)
+    
+    @staticmethod
+    def validate_batch(
+        rules: List[Union[ValidationRule, str]],
+        value: Any,
+        context: dict = None,
+        now: date = None
+    ) -> List[Tuple[bool, str]]:
+        """
+        Validiert einen Wert gegen mehrere Regeln
         
-        if rule == "date_after_eintrittsdatum":
-            if not value or 'eintrittsdatum' not in context:
-                return (True, "")
-            try:
-                d = date.fromisoformat(value) if isinstance(value, str) else value
-                eintritt = date.fromisoformat(context['eintrittsdatum']) if isinstance(context['eintrittsdatum'], str) else context['eintrittsdatum']
-                valid = d >= eintritt
-                return (valid, "Austrittsdatum muss nach Eintrittsdatum liegen" if not valid else "")
-            except:
-                return (False, "Ungültiges Datum")
+        Der Kontext wird nur einmal normalisiert (Datums-Strings → date)
+        und dann, wie das Referenzdatum, für alle Regeln wiederverwendet.
         
-        if rule == "positive":
-            try:
-                valid = float(value) > 0
-                return (valid, "Wert muss positiv sein" if not valid else "")
-            except:
-                return (False, "Ungültige Zahl")
+        Args:
+            rules: ValidationRules oder Regelnamen
+            value: Zu validierender Wert
+            context: Kontext-Daten (andere Felder)
+            now: Referenzdatum für Datumsregeln (default: date.today())
         
-        # Default: Regel nicht bekannt
-        return (True, "")
+        Returns:
+            Liste von (is_valid, error_message) in Reihenfolge der Regeln
+        """
+        context = _normalize_context(context) if context else None
+        now = now or date.today()
+        results = []
+        
+        for rule in rules:
+            if isinstance(rule, str):
+                rule = _RULE_BY_VALUE.get(rule, rule)
+            fn = _RULES.get(rule)
+            results.append(fn(value, context, now) if fn is not None else (True, ""))
+        
+        return results
 
 
 # ============================================================
 # WORKFLOW STEPS
 # ============================================================
 
-class WorkflowStepRegistry:
-    """Registry für Workflow-Schritte"""
-    _steps = []
-    
-    @classmethod
-    def register(cls, step_def):
-        """Registriert einen Workflow-Schritt"""
-        cls._steps.append(step_def)
-        cls._steps.sort(key=lambda x: x['order'])
+# Workflow-Schritte, sortiert nach order
+_WORKFLOW_STEPS: List[dict] = []
+_step_order = itemgetter('order')
+_steps_version = 0
+
+
+def register_step(step_def: dict):
+    """Registriert einen Workflow-Schritt"""
+    global _steps_version
     
-    @classmethod
-    def get_all(cls):
-        """Gibt alle Schritte zurück"""
-        return cls._steps
+    step_def['groups'] = [sys.intern(g) for g in step_def['groups']]
+    show_if = step_def.get('show_if')
+    step_def['show_if_name'] = show_if.__name__ if show_if else None
+    # Sortiert einfügen (stabil: gleiche order bleibt in Registrierungsreihenfolge)
+    bisect.insort(_WORKFLOW_STEPS, step_def, key=_step_order)
+    _steps_version += 1
+
+
+def get_all_steps() -> List[dict]:
+    """Gibt alle Schritte zurück"""
+    return _WORKFLOW_STEPS
+
+
+def steps_version() -> int:
+    """Änderungszähler der Registry"""
+    return _steps_version
+
+
+def clear_steps():
+    """Löscht alle Schritte (für Tests)"""
+    global _steps_version
     
-    @classmethod
-    def clear(cls):
-        """Löscht alle Schritte (für Tests)"""
-        cls._steps = []
+    _WORKFLOW_STEPS.clear()
+    _steps_version += 1
+
+
+class WorkflowStepRegistry:
+    """Registry für Workflow-Schritte (Namespace, kompatible API)"""
+    register = staticmethod(register_step)
+    get_all = staticmethod(get_all_steps)
+    version = staticmethod(steps_version)
+    clear = staticmethod(clear_steps)
 
 
 def workflow_step(
@@ -349,7 +664,7 @@ def workflow_step(
             'class_name': cls.__name__
         }
         
-        WorkflowStepRegistry.register(step_def)
+        register_step(step_def)
         
         return cls
     
@@ -370,8 +685,8 @@ class Conditions:
         if not eintritt:
             return False
         if isinstance(eintritt, str):
-            eintritt = date.fromisoformat(eintritt)
-        return eintritt >= date.fromisoformat(stichtag)
+            eintritt = _parse_iso(eintritt)
+        return eintritt >= _parse_iso(stichtag)
     
     @staticmethod
     def has_austrittsdatum(data: dict) -> bool:
@@ -381,7 +696,8 @@ class Conditions:
     @staticmethod
     def is_unverfallbar(data: dict) -> bool:
         """Prüft Unverfallbarkeit (wird vom Backend berechnet)"""
-        return data.get('_computed', {}).get('ist_unverfallbar', False)
+        computed = data.get('_computed')
+        return computed.get('ist_unverfallbar', False) if computed else False
 
 
 def show_if(condition_func: Callable[[dict], bool]):
@@ -4,19 +4,289 @@ Generiert UI-Schemas, React Components und TypeScript aus annotierten Python-Kla
 """
 
 import json
-from dataclasses import fields, is_dataclass
-from typing import get_type_hints, get_origin, get_args, Union, Dict, List, Any
+from dataclasses import fields
+from typing import get_type_hints, get_origin, get_args, Union, Dict, List, Any, Tuple, Final, Callable
 from datetime import date, datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 import inspect
 
+try:
+    import orjson
+except ImportError:  # optional: schnellerer JSON-Export
+    orjson = None
+
 from annotations import (
-    CalculatedFieldRegistry,
-    WorkflowStepRegistry,
+    get_all_calcs,
+    get_all_steps,
+    calc_version,
+    steps_version,
     ValidationRule
 )
 
 
+@lru_cache(maxsize=None)
+def _cached_type_hints(cls) -> Dict[str, Any]:
+    """get_type_hints() pro Klasse nur einmal auswerten"""
+    return get_type_hints(cls)
+
+
+@lru_cache(maxsize=None)
+def _cached_fields(cls) -> Tuple:
+    """dataclasses.fields() pro Klasse nur einmal auswerten"""
+    return fields(cls)
+
+
+# Python-Typ → UI-Typ
+_UI_TYPE_MAP: Final = {
+    str: 'text',
+    int: 'number',
+    float: 'number',
+    bool: 'checkbox',
+    date: 'date',
+}
+
+
+@lru_cache(maxsize=None)
+def _field_type_table(cls) -> Dict[str, Tuple[Any, bool]]:
+    """
+    Löst Optional[X] für alle Felder einer Klasse einmalig auf
+    
+    Returns:
+        {field_name: (basistyp, ist_optional)}
+    """
+    table = {}
+    
+    for name, python_type in _cached_type_hints(cls).items():
+        optional = False
+        if get_origin(python_type) is Union:
+            args = get_args(python_type)
+            optional = type(None) in args
+            python_type = next((arg for arg in args if arg is not type(None)), str)
+        table[name] = (python_type, optional)
+    
+    return table
+
+
+@lru_cache(maxsize=1024)
+def _label_from_name(field_name: str) -> str:
+    """snake_case → Title Case (Feldnamen sind ein kleines, stabiles Vokabular)"""
+    return field_name.replace('_', ' ').title()
+
+
+@lru_cache(maxsize=None)
+def _date_keys(cls) -> frozenset:
+    """Namen aller date/datetime-typisierten Attribute einer Klasse"""
+    return frozenset(
+        name for name, (base, _) in _field_type_table(cls).items()
+        if isinstance(base, type) and issubclass(base, date)
+    )
+
+
+def _config_as_dict(config) -> Dict[str, Any]:
+    """Attribute der Config als Dict (auch für slots-Dataclasses ohne __dict__)"""
+    if hasattr(type(config), '__dataclass_fields__'):
+        return {f.name: getattr(config, f.name) for f in _cached_fields(type(config))}
+    return dict(getattr(config, '__dict__', {}))
+
+
+# Tailwind-Klassen der generierten Eingabefelder
+_INPUT_CLS: Final = "w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500"
+
+# Gruppen-Labels
+_GROUP_LABELS: Final = {
+    'identifikation': 'Identifikation',
+    'stammdaten': 'Stammdaten',
+    'gehalt': 'Gehaltsdaten',
+    'berechnungen': 'Berechnete Werte',
+    'default': 'Weitere Angaben',
+}
+
+# UI-Typ → TypeScript-Typ
+_TS_TYPE_MAP: Final = {
+    'text': 'string',
+    'number': 'number',
+    'date': 'string',  # ISO date string
+    'checkbox': 'boolean',
+    'select': 'string',
+}
+
+
+@lru_cache(maxsize=None)
+def _ts_member_suffix(ui_type: str, required: bool) -> str:
+    """'?: typ;' bzw. ': typ;' für eine Interface-Zeile (pro Typ/required-Kombination einmal)"""
+    optional = '' if required else '?'
+    return f"{optional}: {_TS_TYPE_MAP.get(ui_type, 'string')};\n"
+
+
+# Interface-Zeile für berechnete Felder (immer optional, immer number)
+_TS_CALC_MEMBER: Final = "  {id}?: number;  // {label}\n"
+
+
+# ============================================================================
+# REACT TEMPLATES (einmal beim Import definiert, per format_map gefüllt)
+# ============================================================================
+
+_REACT_HEADER = '''import React from 'react';
+
+/**
+ * Auto-generiert aus Python Dataclass
+ * {title}
+ * Generated: {generated_at}
+ */
+export default function {class_name}Form({{ data, onChange }}) {{
+  const handleChange = (fieldId, value) => {{
+    onChange({{ ...data, [fieldId]: value }});
+  }};
+
+  return (
+    <div className="space-y-6">
+'''
+
+_REACT_GROUP_OPEN = '''
+      {{/* Gruppe: {label} */}}
+      <div className="bg-white rounded-xl shadow-lg p-6">
+        <h3 className="text-lg font-bold text-gray-900 mb-4">{label}</h3>
+        <div className="space-y-4">
+'''
+
+_REACT_COND_OPEN = '''
+          {{data.{depends_on} && (
+'''
+
+_REACT_FIELD_OPEN = '''
+          <div>
+            <label className="block text-sm font-medium text-gray-700 mb-1">
+              {label}{required_mark}
+            </label>
+'''
+
+def _with_input_cls(template: str) -> str:
+    """Setzt die festen Tailwind-Klassen schon beim Import ein"""
+    return template.replace('{input_cls}', _INPUT_CLS)
+
+
+# Eingabefelder pro UI-Typ ({id} = Feld-ID)
+_DATE_JSX = _with_input_cls('''
+            <input
+              type="date"
+              value={{data.{id} || ''}}
+              onChange={{(e) => handleChange('{id}', e.target.value)}}
+              className="{input_cls}"
+            />
+''')
+
+_NUMBER_JSX = _with_input_cls('''
+            <input
+              type="number"
+              step="0.01"
+              value={{data.{id} || ''}}
+              onChange={{(e) => handleChange('{id}', parseFloat(e.target.value) || '')}}
+              className="{input_cls}"
+            />
+''')
+
+_SELECT_JSX = _with_input_cls('''
+            <select
+              value={{data.{id} || ''}}
+              onChange={{(e) => handleChange('{id}', e.target.value)}}
+              className="{input_cls}"
+            >
+              <option value="">Bitte wählen...</option>
+''')
+
+_OPTION_JSX = '''              <option value="{0}">{1}</option>\n'''
+
+_SELECT_CLOSE_JSX = '''            </select>
+'''
+
+_TEXT_JSX = _with_input_cls('''
+            <input
+              type="text"
+              value={{data.{id} || ''}}
+              onChange={{(e) => handleChange('{id}', e.target.value)}}
+              placeholder="{placeholder}"
+              className="{input_cls}"
+            />
+''')
+
+_REACT_HINT = '''
+            <p className="text-xs text-gray-500 mt-1">{hint}</p>
+'''
+
+_REACT_FIELD_CLOSE = '''
+          </div>
+'''
+
+_REACT_COND_CLOSE = '''
+          )}
+'''
+
+_REACT_GROUP_CLOSE = '''
+        </div>
+      </div>
+'''
+
+_REACT_FOOTER = '''
+    </div>
+  );
+}
+'''
+
+
+# Optionale Feld-Keys (Schema-Key, Metadata-Key) in Ausgabereihenfolge
+_TEXT_KEYS: Final = (
+    ('hint', 'ui_hint'),
+    ('placeholder', 'ui_placeholder'),
+)
+_OPTIONAL_KEYS: Final = (
+    ('min_value', 'ui_min'),
+    ('max_value', 'ui_max'),
+    ('depends_on', 'ui_depends_on'),
+    ('show_when', 'ui_show_when'),
+    ('options', 'ui_options'),
+)
+
+
+def _normalize_validation(value) -> List:
+    """Validierungsregeln immer als Liste"""
+    return value if isinstance(value, list) else ([value] if value else [])
+
+
+# Puffergröße beim Streamen der generierten Dateien
+_WRITE_BUFFER: Final = 1 << 16
+
+
+def _dump_json(obj, pretty: bool = False) -> bytes:
+    """
+    Serialisiert das Schema als JSON-Bytes (orjson, falls installiert)
+    
+    Args:
+        obj: Schema-Dictionary
+        pretty: Eingerückt (für Menschen) statt kompakt (für Tools)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('ascii')
+
+
+def _with_timestamp(schema: Dict) -> Dict:
+    """
+    Setzt meta.generated_at, falls noch nicht gesetzt
+    
+    Das gecachte Schema bleibt unverändert; es wird eine flache Kopie mit
+    neuem meta-Dict zurückgegeben.
+    """
+    meta = schema['meta']
+    if meta.get('generated_at'):
+        return schema
+    return {**schema, 'meta': {**meta, 'generated_at': datetime.now().isoformat()}}
+
+
 class EnhancedFormGenerator:
     """
     Vollständiger Generator für UI-Schemas aus annotierten Python-Code
@@ -45,50 +315,47 @@ class EnhancedFormGenerator:
             config: Konfigurationsobjekt
             berechnung_class: Klasse mit Berechnungsmethoden
         """
-        if not is_dataclass(input_dataclass):
+        if not (isinstance(input_dataclass, type) and hasattr(input_dataclass, '__dataclass_fields__')):
             raise ValueError(f"{input_dataclass} muss eine Dataclass sein")
         
         self.input_dataclass = input_dataclass
         self.config = config
         self.berechnung_class = berechnung_class
         
-        self.type_hints = get_type_hints(input_dataclass)
+        self.type_hints = _cached_type_hints(input_dataclass)
+        self._field_info = _field_type_table(input_dataclass)
+        self._fields = _cached_fields(input_dataclass)
+        self._schema_cache = None
+        self._schema_versions = None
+        
+        # Extrahierte Registry-Inhalte, gültig solange sich die Version nicht ändert
+        self._calc_cache = None
+        self._calc_cache_version = -1
+        self._workflow_cache = None
+        self._workflow_cache_version = -1
+        
+        # Datums-Attribute der Config einmalig aus den Type Hints bestimmen
+        # (None: keine Dataclass, Datumswerte beim Export am Wert erkennen)
+        if config is None:
+            self._config_date_keys = frozenset()
+        elif hasattr(type(config), '__dataclass_fields__'):
+            self._config_date_keys = _date_keys(type(config))
+        else:
+            self._config_date_keys = None
     
-    def _infer_ui_type(self, python_type) -> str:
-        """Leitet UI-Typ aus Python-Typ ab"""
-        # Handle Optional[X]
-        origin = get_origin(python_type)
-        if origin is Union:
-            args = get_args(python_type)
-            python_type = next((arg for arg in args if arg is not type(None)), str)
-        
-        # Type mapping
-        type_map = {
-            str: 'text',
-            int: 'number',
-            float: 'number',
-            bool: 'checkbox',
-            date: 'date',
-        }
-        
-        return type_map.get(python_type, 'text')
+    def _infer_ui_type(self, field_name: str) -> str:
+        """Leitet UI-Typ aus Python-Typ des Feldes ab (Optional[X] → X)"""
+        base, _ = self._field_info.get(field_name, (None, False))
+        return _UI_TYPE_MAP.get(base, 'text')
     
     def _infer_label(self, field_name: str) -> str:
         """Generiert Label aus Feldname (snake_case → Title Case)"""
-        return field_name.replace('_', ' ').title()
+        return _label_from_name(field_name)
     
     def _is_required(self, field_name: str) -> bool:
         """Prüft ob Feld required ist (nicht Optional)"""
-        field_type = self.type_hints.get(field_name)
-        if not field_type:
-            return True
-        
-        origin = get_origin(field_type)
-        if origin is Union:
-            args = get_args(field_type)
-            return type(None) not in args
-        
-        return True
+        _, optional = self._field_info.get(field_name, (None, False))
+        return not optional
     
     def extract_input_fields(self) -> List[Dict]:
         """
@@ -99,44 +366,41 @@ class EnhancedFormGenerator:
         """
         fields_list = []
         
-        for field_obj in fields(self.input_dataclass):
+        for field_obj in self._fields:
             field_name = field_obj.name
-            metadata = field_obj.metadata or {}
+            get = (field_obj.metadata or {}).get
             
-            # Auto-Ableitung mit Metadata-Override
+            # Auto-Ableitung mit Metadata-Override (None-Werte werden gar nicht erst eingetragen)
             field_def = {
                 'id': field_name,
                 'field_type': 'input',
-                'label': metadata.get('ui_label') or self._infer_label(field_name),
-                'type': metadata.get('ui_type') or self._infer_ui_type(field_obj.type),
-                'required': metadata.get('ui_required', self._is_required(field_name)),
-                'hint': metadata.get('ui_hint'),
-                'placeholder': metadata.get('ui_placeholder'),
-                'group': metadata.get('ui_group', 'default'),
-                'order': metadata.get('ui_order', 0),
-                'validation': metadata.get('ui_validation', []),
-                'min_value': metadata.get('ui_min'),
-                'max_value': metadata.get('ui_max'),
-                'depends_on': metadata.get('ui_depends_on'),
-                'show_when': metadata.get('ui_show_when'),
-                'options': metadata.get('ui_options'),
-                'width': metadata.get('ui_width', 'full'),
-                'css_class': metadata.get('ui_class')
+                'label': get('ui_label') or self._infer_label(field_name),
+                'type': get('ui_type') or self._infer_ui_type(field_name),
+                'required': get('ui_required', self._is_required(field_name)),
             }
+            for key, meta_key in _TEXT_KEYS:
+                value = get(meta_key)
+                if value is not None:
+                    field_def[key] = value
             
-            # Cleanup None values
-            field_def = {k: v for k, v in field_def.items() if v is not None}
+            field_def['group'] = get('ui_group', 'default')
+            field_def['order'] = get('ui_order', 0)
+            field_def['validation'] = _normalize_validation(get('ui_validation'))
             
-            # Ensure validation is always a list
-            if 'validation' not in field_def:
-                field_def['validation'] = []
-            elif not isinstance(field_def['validation'], list):
-                field_def['validation'] = [field_def['validation']]
+            for key, meta_key in _OPTIONAL_KEYS:
+                value = get(meta_key)
+                if value is not None:
+                    field_def[key] = value
+            
+            field_def['width'] = get('ui_width', 'full')
+            css_class = get('ui_class')
+            if css_class is not None:
+                field_def['css_class'] = css_class
             
             fields_list.append(field_def)
         
         # Sortiere nach group und order
-        fields_list.sort(key=lambda f: (f['group'], f.get('order', 0)))
+        fields_list.sort(key=itemgetter('group', 'order'))
         
         return fields_list
     
@@ -147,25 +411,31 @@ class EnhancedFormGenerator:
         Returns:
             Liste von Calculated Field Definitionen
         """
+        version = calc_version()
+        if self._calc_cache_version == version:
+            return self._calc_cache
+        
         calc_fields = []
         
-        for key, meta in CalculatedFieldRegistry.get_all().items():
+        for key, spec in get_all_calcs().items():
             calc_fields.append({
                 'id': key,
                 'field_type': 'calculated',
-                'label': meta['label'],
-                'formel': meta['formel'],
-                'requires': meta['requires'],
-                'einheit': meta['einheit'],
-                'editable': meta['editable'],
-                'needs_confirmation': meta['needs_confirmation'],
-                'confirmation_threshold': meta['confirmation_threshold'],
-                'group': meta['group'],
-                'hint': meta['hint'],
-                'precision': meta['precision'],
-                'function_name': meta['function_name']
+                'label': spec.label,
+                'formel': spec.formel,
+                'requires': list(spec.requires),
+                'einheit': spec.einheit,
+                'editable': spec.editable,
+                'needs_confirmation': spec.needs_confirmation,
+                'confirmation_threshold': spec.confirmation_threshold,
+                'group': spec.group,
+                'hint': spec.hint,
+                'precision': spec.precision,
+                'function_name': spec.function_name
             })
         
+        self._calc_cache = calc_fields
+        self._calc_cache_version = version
         return calc_fields
     
     def extract_workflow(self) -> Dict:
@@ -175,27 +445,33 @@ class EnhancedFormGenerator:
         Returns:
             Dictionary mit Workflow-Definition
         """
+        version = steps_version()
+        if self._workflow_cache_version == version:
+            return self._workflow_cache
+        
         steps = []
         
-        for step_def in WorkflowStepRegistry.get_all():
+        for step_def in get_all_steps():
             steps.append({
                 'order': step_def['order'],
                 'title': step_def['title'],
                 'description': step_def['description'],
                 'groups': step_def['groups'],
                 'component_type': step_def['component_type'],
-                'show_if': step_def['show_if'].__name__ if step_def.get('show_if') else None
+                'show_if': step_def['show_if_name']
             })
         
-        return {'steps': steps}
+        self._workflow_cache = {'steps': steps}
+        self._workflow_cache_version = version
+        return self._workflow_cache
     
     def _extract_validation_rules(self, fields_list: List[Dict]) -> Dict:
         """Extrahiert alle verwendeten Validierungsregeln"""
-        rules = set()
-        
-        for field_def in fields_list:
-            for rule in field_def.get('validation', []):
-                rules.add(rule)
+        rules = {
+            rule
+            for field_def in fields_list
+            for rule in field_def.get('validation') or ()
+        }
         
         return {
             'rules': list(rules),
@@ -208,38 +484,56 @@ class EnhancedFormGenerator:
         """
         Generiert vollständiges Schema mit allem
         
+        Das Schema wird beim ersten Aufruf gebaut und danach wiederverwendet,
+        bis sich eine der Registries ändert oder invalidate() aufgerufen wird.
+        
         Returns:
             Vollständiges Schema-Dictionary
         """
+        versions = (calc_version(), steps_version())
+        if self._schema_cache is None or self._schema_versions != versions:
+            self._schema_cache = self._build_schema()
+            self._schema_versions = versions
+        return self._schema_cache
+    
+    def invalidate(self):
+        """Verwirft alle gecachten Ergebnisse"""
+        self._schema_cache = None
+        self._calc_cache_version = -1
+        self._workflow_cache_version = -1
+    
+    def _build_schema(self) -> Dict:
+        """Baut das Schema-Dictionary neu auf"""
         input_fields = self.extract_input_fields()
         calc_fields = self.extract_calculated_fields()
         workflow = self.extract_workflow()
         
-        # Gruppiere Input Fields
-        groups = {}
-        for field_def in input_fields:
-            group_name = field_def['group']
-            if group_name not in groups:
-                groups[group_name] = []
-            groups[group_name].append(field_def)
+        # Gruppiere Input Fields (bereits nach group sortiert)
+        groups = {
+            group_name: list(group_fields)
+            for group_name, group_fields in groupby(input_fields, key=itemgetter('group'))
+        }
         
         # Kombiniere alle Felder
-        all_fields = input_fields + calc_fields
+        all_fields = [*input_fields, *calc_fields]
         
         # Config als Dict
         config_dict = {}
         if self.config:
-            if hasattr(self.config, '__dict__'):
-                config_dict = {
-                    k: v.isoformat() if isinstance(v, date) else v
-                    for k, v in self.config.__dict__.items()
-                }
+            config_dict = _config_as_dict(self.config)
+            if self._config_date_keys is None:
+                date_keys = [k for k, v in config_dict.items() if isinstance(v, date)]
+            else:
+                date_keys = self._config_date_keys & config_dict.keys()
+            for key in date_keys:
+                if config_dict[key] is not None:
+                    config_dict[key] = config_dict[key].isoformat()
         
         schema = {
             'meta': {
                 'title': self.input_dataclass.__doc__ or self.input_dataclass.__name__,
                 'class_name': self.input_dataclass.__name__,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': None  # wird erst beim Rendern/Speichern gesetzt
             },
             'config': config_dict,
             'input_fields': input_fields,
@@ -262,43 +556,36 @@ class EnhancedFormGenerator:
         if schema is None:
             schema = self.generate_complete_schema()
         
-        type_map = {
-            'text': 'string',
-            'number': 'number',
-            'date': 'string',  # ISO date string
-            'checkbox': 'boolean',
-            'select': 'string'
-        }
-        
-        interface = f'''/**
+        parts = []
+        self._emit_typescript(_with_timestamp(schema), parts.append)
+        return ''.join(parts)
+    
+    def _emit_typescript(self, schema: Dict, write: Callable[[str], Any]):
+        """Schreibt das TypeScript Interface stückweise über write()"""
+        write(f'''/**
  * Auto-generiert aus Python Dataclass: {schema['meta']['class_name']}
  * Generated: {schema['meta']['generated_at']}
  */
 export interface {schema['meta']['class_name']}Data {{
-'''
+''')
         
         # Input Fields
         for field_def in schema['input_fields']:
-            ts_type = type_map.get(field_def['type'], 'string')
-            optional = '?' if not field_def.get('required', True) else ''
-            
             if field_def.get('hint'):
-                interface += f"  /** {field_def['hint']} */\n"
+                write(f"  /** {field_def['hint']} */\n")
             
-            interface += f"  {field_def['id']}{optional}: {ts_type};\n"
+            write(f"  {field_def['id']}{_ts_member_suffix(field_def['type'], field_def.get('required', True))}")
         
-        interface += '}\n\n'
+        write('}\n\n')
         
         # Calculated Fields Interface
         if schema['calculated_fields']:
-            interface += f'''export interface {schema['meta']['class_name']}Calculated {{
-'''
+            write(f'''export interface {schema['meta']['class_name']}Calculated {{
+''')
             for calc_field in schema['calculated_fields']:
-                interface += f"  {calc_field['id']}?: number;  // {calc_field['label']}\n"
+                write(_TS_CALC_MEMBER.format_map(calc_field))
             
-            interface += '}\n'
-        
-        return interface
+            write('}\n')
     
     def generate_react_form(self, schema: Dict = None) -> str:
         """
@@ -310,142 +597,73 @@ export interface {schema['meta']['class_name']}Data {{
         if schema is None:
             schema = self.generate_complete_schema()
         
-        component = f'''import React from 'react';
-
-/**
- * Auto-generiert aus Python Dataclass
- * {schema['meta']['title']}
- * Generated: {schema['meta']['generated_at']}
- */
-export default function {schema['meta']['class_name']}Form({{ data, onChange }}) {{
-  const handleChange = (fieldId, value) => {{
-    onChange({{ ...data, [fieldId]: value }});
-  }};
-
-  return (
-    <div className="space-y-6">
-'''
-        
-        # Gruppen-Labels
-        group_labels = {
-            'identifikation': 'Identifikation',
-            'stammdaten': 'Stammdaten',
-            'gehalt': 'Gehaltsdaten',
-            'berechnungen': 'Berechnete Werte',
-            'default': 'Weitere Angaben'
-        }
+        parts = []
+        self._emit_react_form(_with_timestamp(schema), parts.append)
+        return ''.join(parts)
+    
+    def _emit_react_form(self, schema: Dict, write: Callable[[str], Any]):
+        """Schreibt die React Component stückweise über write()"""
+        meta = schema['meta']
+        write(_REACT_HEADER.format_map(meta))
         
         # Generiere pro Gruppe
         for group_name, group_fields in schema['groups'].items():
-            group_label = group_labels.get(group_name, group_name.title())
-            
-            component += f'''
-      {{/* Gruppe: {group_label} */}}
-      <div className="bg-white rounded-xl shadow-lg p-6">
-        <h3 className="text-lg font-bold text-gray-900 mb-4">{group_label}</h3>
-        <div className="space-y-4">
-'''
+            group_label = _GROUP_LABELS.get(group_name, group_name.title())
+            write(_REACT_GROUP_OPEN.format(label=group_label))
             
             for field_def in group_fields:
                 field_id = field_def['id']
-                label = field_def['label']
-                required_mark = ' *' if field_def.get('required', False) else ''
                 hint = field_def.get('hint')
                 field_type = field_def['type']
+                depends_on = field_def.get('depends_on')
                 
                 # Conditional rendering
-                if field_def.get('depends_on'):
-                    component += f'''
-          {{data.{field_def['depends_on']} && (
-'''
+                if depends_on:
+                    write(_REACT_COND_OPEN.format(depends_on=depends_on))
                 
-                component += f'''
-          <div>
-            <label className="block text-sm font-medium text-gray-700 mb-1">
-              {label}{required_mark}
-            </label>
-'''
+                write(_REACT_FIELD_OPEN.format(
+                    label=field_def['label'],
+                    required_mark=' *' if field_def.get('required', False) else '',
+                ))
                 
                 # Input field based on type
                 if field_type == 'date':
-                    component += f'''
-            <input
-              type="date"
-              value={{data.{field_id} || ''}}
-              onChange={{(e) => handleChange('{field_id}', e.target.value)}}
-              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500"
-            />
-'''
+                    write(_DATE_JSX.format_map(field_def))
                 elif field_type == 'number':
-                    component += f'''
-            <input
-              type="number"
-              step="0.01"
-              value={{data.{field_id} || ''}}
-              onChange={{(e) => handleChange('{field_id}', parseFloat(e.target.value) || '')}}
-              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500"
-            />
-'''
+                    write(_NUMBER_JSX.format_map(field_def))
                 elif field_type == 'select' and field_def.get('options'):
-                    component += f'''
-            <select
-              value={{data.{field_id} || ''}}
-              onChange={{(e) => handleChange('{field_id}', e.target.value)}}
-              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500"
-            >
-              <option value="">Bitte wählen...</option>
-'''
+                    write(_SELECT_JSX.format_map(field_def))
                     for value, label in field_def['options']:
-                        component += f'''              <option value="{value}">{label}</option>\n'''
-                    
-                    component += '''            </select>
-'''
+                        write(_OPTION_JSX.format(value, label))
+                    write(_SELECT_CLOSE_JSX)
                 else:  # text
-                    placeholder = field_def.get('placeholder', '')
-                    component += f'''
-            <input
-              type="text"
-              value={{data.{field_id} || ''}}
-              onChange={{(e) => handleChange('{field_id}', e.target.value)}}
-              placeholder="{placeholder}"
-              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500"
-            />
-'''
+                    write(_TEXT_JSX.format(id=field_id, placeholder=field_def.get('placeholder', '')))
                 
                 if hint:
-                    component += f'''
-            <p className="text-xs text-gray-500 mt-1">{hint}</p>
-'''
+                    write(_REACT_HINT.format(hint=hint))
                 
-                component += '''
-          </div>
-'''
+                write(_REACT_FIELD_CLOSE)
                 
                 # Close conditional
-                if field_def.get('depends_on'):
-                    component += '''
-          )}
-'''
+                if depends_on:
+                    write(_REACT_COND_CLOSE)
             
-            component += '''
-        </div>
-      </div>
-'''
-        
-        component += '''
-    </div>
-  );
-}
-'''
+            write(_REACT_GROUP_CLOSE)
         
-        return component
+        write(_REACT_FOOTER)
     
-    def save_all(self, output_dir: str = '/mnt/user-data/outputs') -> Dict[str, Path]:
+    def save_all(
+        self,
+        output_dir: str = '/mnt/user-data/outputs',
+        *,
+        pretty: bool = False
+    ) -> Dict[str, Path]:
         """
         Speichert alle generierten Dateien
         
         Args:
             output_dir: Output-Verzeichnis
+            pretty: complete_schema.json eingerückt statt kompakt schreiben
         
         Returns:
             Dictionary mit Pfaden zu generierten Dateien
@@ -454,29 +672,26 @@ export default function {schema['meta']['class_name']}Form({{ data, onChange }})
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Generiere Schema
-        schema = self.generate_complete_schema()
+        schema = _with_timestamp(self.generate_complete_schema())
         
         # 1. Complete Schema (JSON)
         schema_file = output_path / 'complete_schema.json'
-        schema_file.write_text(
-            json.dumps(schema, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
+        schema_file.write_bytes(_dump_json(schema, pretty))
         
         # 2. React Component
-        react_code = self.generate_react_form(schema)
         react_file = output_path / f'{schema["meta"]["class_name"]}Form.jsx'
-        react_file.write_text(react_code, encoding='utf-8')
+        with react_file.open('w', encoding='utf-8', buffering=_WRITE_BUFFER) as fh:
+            self._emit_react_form(schema, fh.write)
         
         # 3. TypeScript Interface
-        ts_code = self.generate_typescript_interface(schema)
         ts_file = output_path / f'{schema["meta"]["class_name"]}.ts'
-        ts_file.write_text(ts_code, encoding='utf-8')
+        with ts_file.open('w', encoding='utf-8', buffering=_WRITE_BUFFER) as fh:
+            self._emit_typescript(schema, fh.write)
         
         # 4. README
-        readme = self._generate_readme(schema)
         readme_file = output_path / 'README_GENERATED.md'
-        readme_file.write_text(readme, encoding='utf-8')
+        with readme_file.open('w', encoding='utf-8', buffering=_WRITE_BUFFER) as fh:
+            self._emit_readme(schema, fh.write)
         
         return {
             'schema': schema_file,
@@ -487,7 +702,13 @@ export default function {schema['meta']['class_name']}Form({{ data, onChange }})
     
     def _generate_readme(self, schema: Dict) -> str:
         """Generiert README für die generierten Dateien"""
-        readme = f"""# Auto-Generated Forms
+        parts = []
+        self._emit_readme(_with_timestamp(schema), parts.append)
+        return ''.join(parts)
+    
+    def _emit_readme(self, schema: Dict, write: Callable[[str], Any]):
+        """Schreibt das README stückweise über write()"""
+        write(f"""# Auto-Generated Forms
 
 **Generiert:** {schema['meta']['generated_at']}
 **Quelle:** {schema['meta']['class_name']} Python Dataclass
@@ -502,32 +723,32 @@ export default function {schema['meta']['class_name']}Form({{ data, onChange }})
 
 ### Input Fields ({len(schema['input_fields'])})
 
-"""
+""")
         
         for field in schema['input_fields']:
-            readme += f"- **{field['label']}** (`{field['id']}`): {field['type']}"
+            write(f"- **{field['label']}** (`{field['id']}`): {field['type']}")
             if field.get('required'):
-                readme += " *required*"
+                write(" *required*")
             if field.get('hint'):
-                readme += f"\n  - {field['hint']}"
-            readme += "\n"
+                write(f"\n  - {field['hint']}")
+            write("\n")
         
         if schema['calculated_fields']:
-            readme += f"\n### Calculated Fields ({len(schema['calculated_fields'])})\n\n"
+            write(f"\n### Calculated Fields ({len(schema['calculated_fields'])})\n\n")
             for calc in schema['calculated_fields']:
-                readme += f"- **{calc['label']}** (`{calc['id']}`)\n"
-                readme += f"  - Formel: `{calc['formel']}`\n"
-                readme += f"  - Benötigt: {', '.join(calc['requires'])}\n"
+                write(f"- **{calc['label']}** (`{calc['id']}`)\n")
+                write(f"  - Formel: `{calc['formel']}`\n")
+                write(f"  - Benötigt: {', '.join(calc['requires'])}\n")
         
         if schema['workflow']['steps']:
-            readme += f"\n### Workflow ({len(schema['workflow']['steps'])} Schritte)\n\n"
+            write(f"\n### Workflow ({len(schema['workflow']['steps'])} Schritte)\n\n")
             for step in schema['workflow']['steps']:
-                readme += f"{step['order']}. **{step['title']}**"
+                write(f"{step['order']}. **{step['title']}**")
                 if step.get('description'):
-                    readme += f" - {step['description']}"
-                readme += "\n"
+                    write(f" - {step['description']}")
+                write("\n")
         
-        readme += """
+        write("""
 ## Verwendung
 
 ```jsx
@@ -555,6 +776,4 @@ console.log(schema.input_fields);
 console.log(schema.calculated_fields);
 console.log(schema.workflow);
 ```
-"""
-        
-        return readme
+""")
@@ -6,7 +6,9 @@ Automatische Formular-Generierung aus Python-Definitionen
 from datetime import datetime, date
 from typing import Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
+import math
 from pathlib import Path
 
 # Import Annotations
@@ -28,7 +30,7 @@ from enhanced_form_generator import EnhancedFormGenerator
 # KONFIGURATION: VERSORGUNGSORDNUNG
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VersorgungsordnungConfig:
     """Zentrale Konfiguration der Versorgungsordnung"""
     name: str = "Versorgungsordnung für die Angestellten der Muster GmbH vom 01.01.2010"
@@ -181,6 +183,143 @@ class MitarbeiterFormular:
     )
 
 
+# ============================================================
+# RENTENALTER / RENTENBEGINN (reine Funktionen, gecacht)
+# ============================================================
+
+def _rentenalter_berechnen(geburtsjahr: int) -> float:
+    """Gesetzliches Rentenalter nach SGB VI für einen Geburtsjahrgang"""
+    if geburtsjahr < 1947:
+        return 65.0
+    elif geburtsjahr >= 1964:
+        return 67.0
+    elif geburtsjahr <= 1958:
+        # Von 1947 bis 1958: +1 Monat pro Jahrgang
+        monate = geburtsjahr - 1946
+        return 65 + monate / 12
+    else:
+        # Von 1959 bis 1963: 66 Jahre + 2 Monate pro Jahrgang
+        monate = (geburtsjahr - 1958) * 2
+        return 66 + monate / 12
+
+
+def _alter_am(geburtsdatum: date, stichtag: date) -> int:
+    """Alter in vollendeten Jahren (Monat/Tag als eine Zahl verglichen)"""
+    vor_geburtstag = stichtag.month * 32 + stichtag.day < geburtsdatum.month * 32 + geburtsdatum.day
+    return stichtag.year - geburtsdatum.year - vor_geburtstag
+
+
+def _volle_jahre(von: date, bis: date) -> int:
+    """Vollendete Jahre zwischen zwei Daten (mindestens 0)"""
+    jahre = bis.year - von.year
+    
+    if (bis.month, bis.day) < (von.month, von.day):
+        jahre -= 1
+    
+    return max(0, jahre)
+
+
+# Rentenalter je Geburtsjahrgang, einmalig beim Import tabelliert
+_RENTENALTER_AB = 1900
+_RENTENALTER_BIS = 2100
+_RENTENALTER = tuple(
+    _rentenalter_berechnen(jahr) for jahr in range(_RENTENALTER_AB, _RENTENALTER_BIS)
+)
+
+
+def _rentenalter(geburtsjahr: int) -> float:
+    """Rentenalter aus der Tabelle (außerhalb des Bereichs direkt berechnet)"""
+    if _RENTENALTER_AB <= geburtsjahr < _RENTENALTER_BIS:
+        return _RENTENALTER[geburtsjahr - _RENTENALTER_AB]
+    return _rentenalter_berechnen(geburtsjahr)
+
+
+@lru_cache(maxsize=None)
+def _rentenbeginn(geburtsjahr: int, geburtsmonat: int) -> date:
+    """Geplanter Rentenbeginn (Monatserster) für Geburtsjahr/-monat"""
+    rentenalter = _rentenalter(geburtsjahr)
+    rentenalter_jahre = int(rentenalter)
+    rentenalter_monate = round((rentenalter - rentenalter_jahre) * 12)
+    
+    # Überlauf über beliebig viele Jahre, ohne Verzweigung
+    jahre_extra, monat_index = divmod(geburtsmonat - 1 + rentenalter_monate, 12)
+    return date(geburtsjahr + rentenalter_jahre + jahre_extra, monat_index + 1, 1)
+
+
+def _batch_kernel(
+    renten_monat, eintritt_monat, eintritt_tag, m, n, mit_austritt, gehalt,
+    alt_betrag, neu_satz, neu_max,
+    dienstjahre, mn_prozent, grundrente_alt, grundrente_neu
+):
+    """
+    Schleifen-Kernel für VersorgungsBerechnung.batch (wird nur mit numba genutzt)
+    
+    Alle Datumswerte als int64 (Monate seit 1970, Tag im Monat, Tage), damit
+    numba im nopython-Modus kompilieren kann. Die Ergebnisse werden in die
+    vom Aufrufer angelegten Arrays geschrieben.
+    """
+    for i in range(renten_monat.shape[0]):
+        jahre = renten_monat[i] // 12 - eintritt_monat[i] // 12
+        rm = renten_monat[i] % 12
+        em = eintritt_monat[i] % 12
+        if rm < em or (rm == em and eintritt_tag[i] > 1):
+            jahre -= 1
+        if jahre < 0:
+            jahre = 0
+        dienstjahre[i] = jahre
+        
+        kuerzung = 1.0
+        if mit_austritt[i]:
+            faktor = m[i] / n[i] if n[i] != 0 else 0.0
+            mn_prozent[i] = faktor * 100
+            kuerzung = mn_prozent[i] / 100
+        else:
+            mn_prozent[i] = math.nan
+        
+        grundrente_alt[i] = jahre * alt_betrag * kuerzung
+        grundrente_neu[i] = min(jahre * neu_satz * gehalt[i], neu_max * gehalt[i]) * kuerzung
+
+
+@lru_cache(maxsize=1)
+def _batch_kernel_jit():
+    """Mit numba kompilierter Kernel (None ohne numba), erst beim ersten batch-Aufruf"""
+    try:
+        from numba import njit
+    except ImportError:  # optional: siehe requirements.txt
+        return None
+    # Ohne fastmath: Ergebnisse sollen bitgleich zum NumPy-Pfad bleiben
+    return njit(cache=True)(_batch_kernel)
+
+
+# Unverfallbarkeit nach BetrAVG §1b (Dienstjahre, Mindestalter) je Austrittsjahr
+_UNVERFALLBAR_AB_2018 = (3, 21)
+_UNVERFALLBAR_AB_2009 = (5, 25)
+_UNVERFALLBAR_VOR_2009 = (10, 5, 30)  # 10 Jahre allein ODER 5 Jahre + 30 Jahre alt
+
+
+def _unverfallbar(austrittsjahr: int, alter_bei_austritt: int, dienstjahre: int) -> bool:
+    """Regeln der Unverfallbarkeit (einzige Stelle, für Prüfung mit und ohne Begründung)"""
+    if austrittsjahr >= 2018:
+        jahre, alter = _UNVERFALLBAR_AB_2018
+    elif austrittsjahr >= 2009:
+        jahre, alter = _UNVERFALLBAR_AB_2009
+    else:
+        jahre_allein, jahre, alter = _UNVERFALLBAR_VOR_2009
+        if dienstjahre >= jahre_allein:
+            return True
+    return dienstjahre >= jahre and alter_bei_austritt >= alter
+
+
+@dataclass(slots=True, frozen=True)
+class BerechnungsKontext:
+    """Einmal pro Mitarbeiter berechnete Zwischenwerte (siehe build_context)"""
+    rentenbeginn: date
+    dienstjahre: int
+    m_tage: Optional[int] = None        # Eintritt → Austritt (nur mit Austritt)
+    n_tage: Optional[int] = None        # Eintritt → Rentenbeginn (nur mit Austritt)
+    mn_prozent: Optional[float] = None  # m/n × 100 (nur mit Austritt)
+
+
 # ============================================================
 # BERECHNUNGSKLASSE MIT CALCULATED FIELDS
 # ============================================================
@@ -197,40 +336,45 @@ class VersorgungsBerechnung:
     
     def gesetzliches_rentenalter(self, geburtsdatum: date) -> float:
         """Berechnet gesetzliches Rentenalter nach SGB VI"""
-        geburtsjahr = geburtsdatum.year
-        
-        if geburtsjahr < 1947:
-            return 65.0
-        elif geburtsjahr >= 1964:
-            return 67.0
-        elif geburtsjahr <= 1958:
-            # Von 1947 bis 1958: +1 Monat pro Jahrgang
-            monate = geburtsjahr - 1946
-            return 65 + monate / 12
-        else:
-            # Von 1959 bis 1963: 66 Jahre + 2 Monate pro Jahrgang
-            monate = (geburtsjahr - 1958) * 2
-            return 66 + monate / 12
+        return _rentenalter(geburtsdatum.year)
     
     def rentenbeginn(self, geburtsdatum: date) -> date:
         """Berechnet geplanten Rentenbeginn (Monatserster)"""
-        rentenalter = self.gesetzliches_rentenalter(geburtsdatum)
-        rentenalter_jahre = int(rentenalter)
-        rentenalter_monate = round((rentenalter - rentenalter_jahre) * 12)
-        
-        rentenjahr = geburtsdatum.year + rentenalter_jahre
-        rentenmonat = geburtsdatum.month + rentenalter_monate
+        return _rentenbeginn(geburtsdatum.year, geburtsdatum.month)
+    
+    def build_context(
+        self,
+        geburtsdatum: date,
+        eintrittsdatum: date,
+        austrittsdatum: Optional[date] = None
+    ) -> BerechnungsKontext:
+        """
+        Berechnet Rentenbeginn, Dienstzeit und m/n-Faktor eines Mitarbeiters
+        in einem Durchgang, damit Anzeige und Rentenberechnung sie teilen
+        """
+        rentenbeginn = self.rentenbeginn(geburtsdatum)
+        dienstjahre = _volle_jahre(eintrittsdatum, rentenbeginn)
         
-        if rentenmonat > 12:
-            rentenjahr += 1
-            rentenmonat -= 12
+        if not austrittsdatum:
+            return BerechnungsKontext(rentenbeginn, dienstjahre)
         
-        return date(rentenjahr, rentenmonat, 1)
+        m = self.betriebszugehoerigkeit_tage(eintrittsdatum, austrittsdatum)
+        n = self.betriebszugehoerigkeit_tage(eintrittsdatum, rentenbeginn)
+        faktor = m / n if n else 0.0
+        return BerechnungsKontext(rentenbeginn, dienstjahre, m, n, faktor * 100)
     
     def betriebszugehoerigkeit_tage(self, eintritt: date, austritt: date) -> int:
         """Berechnet Betriebszugehörigkeit in Tagen (taggenau)"""
         return (austritt - eintritt).days
     
+    def ist_unverfallbar(self, geburtsdatum: date, eintritt: date, austritt: date) -> bool:
+        """Prüft Unverfallbarkeit nach BetrAVG §1b ohne Begründungstext"""
+        return _unverfallbar(
+            austritt.year,
+            _alter_am(geburtsdatum, austritt),
+            self.betriebszugehoerigkeit_jahre(eintritt, austritt)
+        )
+    
     def unverfallbarkeit_pruefung(
         self, 
         geburtsdatum: date, 
@@ -241,35 +385,34 @@ class VersorgungsBerechnung:
         Prüft Unverfallbarkeit nach BetrAVG §1b
         Returns: (erfuellt, grund)
         """
-        alter_bei_austritt = (austritt.year - geburtsdatum.year) - (
-            1 if (austritt.month, austritt.day) < (geburtsdatum.month, geburtsdatum.day) else 0
-        )
-        
+        alter_bei_austritt = _alter_am(geburtsdatum, austritt)
         dienstjahre = self.betriebszugehoerigkeit_jahre(eintritt, austritt)
         austrittsjahr = austritt.year
         
+        # Ergebnis aus der gemeinsamen Regel, hier nur noch die Begründung formulieren
+        erfuellt = _unverfallbar(austrittsjahr, alter_bei_austritt, dienstjahre)
+        
         # Regelung ab 2018
         if austrittsjahr >= 2018:
-            if dienstjahre >= 3 and alter_bei_austritt >= 21:
-                return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt (Regelung ab 2018: mind. 3 Jahre + 21 Jahre)")
-            else:
-                return (False, f"Nicht erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt (Regelung ab 2018 erfordert: mind. 3 Jahre + 21 Jahre)")
+            jahre, alter = _UNVERFALLBAR_AB_2018
+            if erfuellt:
+                return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt (Regelung ab 2018: mind. {jahre} Jahre + {alter} Jahre)")
+            return (False, f"Nicht erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt (Regelung ab 2018 erfordert: mind. {jahre} Jahre + {alter} Jahre)")
         
         # Regelung 2009-2017
-        elif austrittsjahr >= 2009:
-            if dienstjahre >= 5 and alter_bei_austritt >= 25:
+        if austrittsjahr >= 2009:
+            jahre, alter = _UNVERFALLBAR_AB_2009
+            if erfuellt:
                 return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt")
-            else:
-                return (False, f"Nicht erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt (benötigt: 5 Jahre + 25 Jahre)")
+            return (False, f"Nicht erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt (benötigt: {jahre} Jahre + {alter} Jahre)")
         
         # Regelung vor 2009
-        else:
-            if dienstjahre >= 10:
-                return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit")
-            elif dienstjahre >= 5 and alter_bei_austritt >= 30:
-                return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt")
-            else:
-                return (False, f"Nicht erfüllt (benötigt: 10 Jahre ODER 5 Jahre + 30 Jahre)")
+        jahre_allein, jahre, alter = _UNVERFALLBAR_VOR_2009
+        if not erfuellt:
+            return (False, f"Nicht erfüllt (benötigt: {jahre_allein} Jahre ODER {jahre} Jahre + {alter} Jahre)")
+        if dienstjahre >= jahre_allein:
+            return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit")
+        return (True, f"Erfüllt: {dienstjahre} Jahre Dienstzeit, {alter_bei_austritt} Jahre alt")
     
     # ==========================================
     # CALCULATED FIELDS (mit Annotation)
@@ -297,13 +440,7 @@ class VersorgungsBerechnung:
         Berechnet potenzielle Dienstzeit in vollendeten Jahren
         Eintritt bis geplanter Rentenbeginn
         """
-        rentenbeginn = self.rentenbeginn(geburtsdatum)
-        jahre = rentenbeginn.year - eintrittsdatum.year
-        
-        if (rentenbeginn.month, rentenbeginn.day) < (eintrittsdatum.month, eintrittsdatum.day):
-            jahre -= 1
-        
-        return max(0, jahre)
+        return _volle_jahre(eintrittsdatum, self.rentenbeginn(geburtsdatum))
     
     def mn_faktor(
         self,
@@ -410,8 +547,9 @@ class VersorgungsBerechnung:
         Berechnet Rente nach Neu-Regelung
         Verwendet ggf. überschriebene Dienstzeit
         """
-        jahresrente = dienstjahre * self.config.neu_versorgungssatz * letztes_gehalt
-        max_rente = self.config.neu_max_versorgungsgrad * letztes_gehalt
+        config = self.config
+        jahresrente = dienstjahre * config.neu_versorgungssatz * letztes_gehalt
+        max_rente = config.neu_max_versorgungsgrad * letztes_gehalt
         grundrente = min(jahresrente, max_rente)
         
         # m/n-Faktor bei vorzeitigem Austritt
@@ -420,6 +558,109 @@ class VersorgungsBerechnung:
             return grundrente * (mn_prozent / 100)
         
         return grundrente
+    
+    # ==========================================
+    # BATCH-BERECHNUNG (NumPy, mehrere Mitarbeiter)
+    # ==========================================
+    
+    def batch(
+        self,
+        geburtsdatum,
+        eintrittsdatum,
+        austrittsdatum=None,
+        letztes_gehalt=None
+    ) -> dict:
+        """
+        Berechnet Rentenbeginn, Dienstzeit, m/n-Faktor und Grundrenten für
+        viele Mitarbeiter auf einmal (datetime64-Arithmetik statt date-Objekte)
+        
+        Benötigt numpy (wird erst hier importiert, nicht beim Modul-Import).
+        
+        Args:
+            geburtsdatum, eintrittsdatum: Sequenzen von date (oder datetime64[D])
+            austrittsdatum: Optional, None-Einträge = kein Austritt
+            letztes_gehalt: Optional, None-Einträge = 0
+        
+        Returns:
+            Dict von Arrays: rentenbeginn, dienstjahre, m_tage, n_tage,
+            mn_prozent (NaN ohne Austritt), grundrente_alt, grundrente_neu
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(
+                "VersorgungsBerechnung.batch benötigt numpy (pip install numpy)"
+            ) from exc
+        
+        geburt = np.asarray(geburtsdatum, dtype='datetime64[D]')
+        eintritt = np.asarray(eintrittsdatum, dtype='datetime64[D]')
+        anzahl = len(geburt)
+        if austrittsdatum is None:
+            austritt = np.full(anzahl, np.datetime64('NaT'), dtype='datetime64[D]')
+        else:
+            austritt = np.asarray(austrittsdatum, dtype='datetime64[D]')
+        if letztes_gehalt is None:
+            gehalt = np.zeros(anzahl)
+        else:
+            gehalt = np.nan_to_num(np.asarray(letztes_gehalt, dtype=float))
+        
+        # Rentenbeginn: Rentenalter aus der Tabelle (außerhalb 1900-2099 ist die
+        # Staffel konstant, daher genügt Clipping)
+        geburt_monat = geburt.astype('datetime64[M]').astype(np.int64)
+        geburtsjahr = geburt_monat // 12 + 1970
+        jahr_index = np.clip(geburtsjahr - _RENTENALTER_AB, 0, len(_RENTENALTER) - 1)
+        rentenalter = np.array(_RENTENALTER)[jahr_index]
+        alter_jahre = rentenalter.astype(np.int64)
+        alter_monate = np.round((rentenalter - alter_jahre) * 12).astype(np.int64)
+        renten_monat = geburt_monat + alter_jahre * 12 + alter_monate
+        rentenbeginn = renten_monat.astype('datetime64[M]').astype('datetime64[D]')
+        
+        eintritt_monat = eintritt.astype('datetime64[M]').astype(np.int64)
+        eintritt_tag = (eintritt - eintritt.astype('datetime64[M]')).astype(np.int64) + 1
+        mit_austritt = ~np.isnat(austritt)
+        m = np.where(mit_austritt, (austritt - eintritt).astype(np.int64), 0)
+        n = np.where(mit_austritt, (rentenbeginn - eintritt).astype(np.int64), 0)
+        
+        cfg = self.config
+        kernel = _batch_kernel_jit()
+        if kernel is not None:
+            dienstjahre = np.empty(anzahl, dtype=np.int64)
+            mn_prozent = np.empty(anzahl)
+            grundrente_alt = np.empty(anzahl)
+            grundrente_neu = np.empty(anzahl)
+            kernel(
+                renten_monat, eintritt_monat, eintritt_tag, m, n, mit_austritt, gehalt,
+                cfg.alt_betrag_pro_jahr, cfg.neu_versorgungssatz, cfg.neu_max_versorgungsgrad,
+                dienstjahre, mn_prozent, grundrente_alt, grundrente_neu
+            )
+        else:
+            # Volle Jahre Eintritt → Rentenbeginn (Rentenbeginn ist immer der 1.)
+            jahre = renten_monat // 12 - eintritt_monat // 12
+            vor_jahrestag = (renten_monat % 12 < eintritt_monat % 12) | (
+                (renten_monat % 12 == eintritt_monat % 12) & (eintritt_tag > 1)
+            )
+            dienstjahre = np.maximum(jahre - vor_jahrestag, 0)
+            
+            # m/n-Faktor (nur mit Austritt)
+            faktor = np.divide(m, n, out=np.zeros(anzahl), where=n != 0)
+            mn_prozent = np.where(mit_austritt, faktor * 100, np.nan)
+            kuerzung = np.where(mit_austritt, mn_prozent / 100, 1.0)
+            
+            grundrente_alt = dienstjahre * cfg.alt_betrag_pro_jahr * kuerzung
+            grundrente_neu = np.minimum(
+                dienstjahre * cfg.neu_versorgungssatz * gehalt,
+                cfg.neu_max_versorgungsgrad * gehalt
+            ) * kuerzung
+        
+        return {
+            'rentenbeginn': rentenbeginn,
+            'dienstjahre': dienstjahre,
+            'm_tage': m,
+            'n_tage': n,
+            'mn_prozent': mn_prozent,
+            'grundrente_alt': grundrente_alt,
+            'grundrente_neu': grundrente_neu,
+        }
 
 
 # ============================================================
@@ -515,10 +756,10 @@ def main():
     
     print("2. REGISTRIERTE CALCULATED FIELDS")
     print("-" * 80)
-    for key, meta in CalculatedFieldRegistry.get_all().items():
-        print(f"✓ {meta['label']} ({key})")
-        print(f"  Formel: {meta['formel']}")
-        print(f"  Benötigt: {', '.join(meta['requires'])}")
+    for key, spec in CalculatedFieldRegistry.get_all().items():
+        print(f"✓ {spec.label} ({key})")
+        print(f"  Formel: {spec.formel}")
+        print(f"  Benötigt: {', '.join(spec.requires)}")
         print()
     
     # 3. Generator erstellen
@@ -8,8 +8,14 @@ import streamlit as st
 import json
 from datetime import date, datetime
 from pathlib import Path
+from types import MappingProxyType
 import sys
 
+try:
+    import orjson
+except ImportError:  # optional: schnelleres Parsen des Schemas
+    orjson = None
+
 # Backend importieren
 sys.path.insert(0, str(Path(__file__).parent))
 try:
@@ -35,69 +41,224 @@ st.set_page_config(
 # SCHEMA LADEN
 # ============================================================
 
-@st.cache_data
 def load_schema():
     schema_path = Path(__file__).parent / 'complete_schema.json'
     if schema_path.exists():
+        if orjson is not None:
+            return orjson.loads(schema_path.read_bytes())
         with open(schema_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     return None
 
-SCHEMA = load_schema()
-
 # ============================================================
 # INITIALISIERUNG
 # ============================================================
 
-config = VersorgungsordnungConfig()
-berechnung = VersorgungsBerechnung(config)
-
-# Session State
-if 'parameter' not in st.session_state:
-    st.session_state.parameter = {}
-if 'formel_bestaetigung' not in st.session_state:
-    st.session_state.formel_bestaetigung = {}
-if 'ma_bestaetigt' not in st.session_state:
-    st.session_state.ma_bestaetigt = {}
-
-# Beispiel-Mitarbeiter
-BEISPIEL_MITARBEITER = [
-    {
-        'name': 'Max Mustermann',
-        'beschreibung': 'Alt-Regelung, 25 Jahre',
-        'daten': {
-            'id': 'max-alt',
+def _examples(config):
+    """Beispiel-Mitarbeiter (schreibgeschützt)"""
+    beispiele = [
+        {
             'name': 'Max Mustermann',
-            'geburtsdatum': date(1960, 3, 15),
-            'eintrittsdatum': date(2000, 1, 1),
-            'austrittsdatum': config.insolvenzdatum,
-        }
-    },
-    {
-        'name': 'Anna Schmidt',
-        'beschreibung': 'Neu-Regelung, 4.500€',
-        'daten': {
-            'id': 'anna-neu',
+            'beschreibung': 'Alt-Regelung, 25 Jahre',
+            'daten': {
+                'id': 'max-alt',
+                'name': 'Max Mustermann',
+                'geburtsdatum': date(1960, 3, 15),
+                'eintrittsdatum': date(2000, 1, 1),
+                'austrittsdatum': config.insolvenzdatum,
+            }
+        },
+        {
             'name': 'Anna Schmidt',
-            'geburtsdatum': date(1980, 7, 22),
-            'eintrittsdatum': date(2010, 3, 1),
-            'austrittsdatum': config.insolvenzdatum,
-            'letztes_gehalt': 4500.0
-        }
-    },
-    {
-        'name': 'Tom Klein',
-        'beschreibung': 'Bagatellrente',
-        'daten': {
-            'id': 'tom-bagatell',
+            'beschreibung': 'Neu-Regelung, 4.500€',
+            'daten': {
+                'id': 'anna-neu',
+                'name': 'Anna Schmidt',
+                'geburtsdatum': date(1980, 7, 22),
+                'eintrittsdatum': date(2010, 3, 1),
+                'austrittsdatum': config.insolvenzdatum,
+                'letztes_gehalt': 4500.0
+            }
+        },
+        {
             'name': 'Tom Klein',
-            'geburtsdatum': date(1988, 9, 20),
-            'eintrittsdatum': date(2020, 1, 1),
-            'austrittsdatum': config.insolvenzdatum,
-            'letztes_gehalt': 2500.0
+            'beschreibung': 'Bagatellrente',
+            'daten': {
+                'id': 'tom-bagatell',
+                'name': 'Tom Klein',
+                'geburtsdatum': date(1988, 9, 20),
+                'eintrittsdatum': date(2020, 1, 1),
+                'austrittsdatum': config.insolvenzdatum,
+                'letztes_gehalt': 2500.0
+            }
         }
-    }
-]
+    ]
+    return tuple(
+        MappingProxyType({**person, 'daten': MappingProxyType(person['daten'])})
+        for person in beispiele
+    )
+
+
+def _prepare_schema(schema):
+    """Ergänzt einmalig abgeleitete Hilfswerte an den Schema-Einträgen"""
+    if schema:
+        for field in schema['input_fields']:
+            field['_key_widget'] = 'f_' + field['id']
+            if field['type'] == 'number':
+                field['_min_value'] = float(field.get('min_value', 0.0))
+        for calc in schema['calculated_fields']:
+            calc['_req_set'] = frozenset(calc['requires'])
+            calc['_key_input'] = 'c_' + calc['id']
+            calc['_key_btn'] = 'btn_' + calc['id']
+    return schema
+
+
+@st.cache_resource
+def bootstrap():
+    """Schema, Config/Berechnung und Beispiele einmal pro Prozess statt bei jedem Rerun"""
+    cfg = VersorgungsordnungConfig()
+    return _prepare_schema(load_schema()), cfg, VersorgungsBerechnung(cfg), _examples(cfg)
+
+SCHEMA, config, berechnung, BEISPIEL_MITARBEITER = bootstrap()
+
+# Anzeige-Texte und Button-Keys der Beispiele für den Datenimport
+_BEISPIEL_SUMMARY = tuple((p['name'], p['beschreibung']) for p in BEISPIEL_MITARBEITER)
+_LADEN_KEYS = tuple(f"load_{idx}" for idx in range(len(BEISPIEL_MITARBEITER)))
+
+
+@st.cache_resource
+def grouped_inputs():
+    """Input-Felder nach Gruppe (Reihenfolge wie im Schema), einmal pro Prozess"""
+    groups = {}
+    for field in SCHEMA['input_fields']:
+        groups.setdefault(field['group'], []).append(field)
+    return groups
+
+
+@st.cache_resource
+def schema_counts():
+    """Anzahl Input-Felder, berechneter Felder und Workflow-Schritte für den Footer"""
+    return (
+        len(SCHEMA['input_fields']),
+        len(SCHEMA['calculated_fields']),
+        len(SCHEMA['workflow']['steps']),
+    )
+
+
+@st.cache_resource
+def schema_tables():
+    """Tabellenzeilen für die Schema-Ansicht (Inputs, Berechnungen, Workflow), einmal pro Prozess"""
+    inputs = [
+        {'Feld': f['label'], 'ID': f['id'], 'Typ': f['type'], 'Gruppe': f['group'], 'Hinweis': f.get('hint') or ''}
+        for f in SCHEMA['input_fields']
+    ]
+    calcs = [
+        {'Feld': c['label'], 'Formel': c['formel'], 'Benötigt': ', '.join(c['requires']), 'Einheit': c['einheit']}
+        for c in SCHEMA['calculated_fields']
+    ]
+    workflow = [
+        {'Nr.': s['order'], 'Schritt': s['title'], 'Beschreibung': s.get('description') or ''}
+        for s in SCHEMA['workflow']['steps']
+    ]
+    return inputs, calcs, workflow
+
+
+# Die Cache-Funktionen bekommen Datums-Ordinalzahlen (int) als Schlüssel;
+# zurück in date gewandelt wird erst beim tatsächlichen Berechnen
+def _ordinal(d):
+    return d.toordinal() if d else None
+
+
+def _datum(ordinal):
+    return date.fromordinal(ordinal) if ordinal is not None else None
+
+
+@st.cache_data(max_entries=256)
+def compute_all(geburt_ord, eintritt_ord, austritt_ord):
+    """Rentenbeginn, Dienstzeit und m/n pro Eingabe-Kombination nur einmal berechnen"""
+    return berechnung.build_context(_datum(geburt_ord), _datum(eintritt_ord), _datum(austritt_ord))
+
+
+@st.cache_data(max_entries=256)
+def pruefe_unverfallbarkeit(geburt_ord, eintritt_ord, austritt_ord):
+    """Unverfallbarkeitsprüfung (Ergebnis + Begründung) pro Eingabe-Kombination cachen"""
+    return berechnung.unverfallbarkeit_pruefung(_datum(geburt_ord), _datum(eintritt_ord), _datum(austritt_ord))
+
+
+def _beispiel_laden(idx):
+    """Beispiel-Mitarbeiter übernehmen, samt Zustand der Eingabe-Widgets"""
+    daten = BEISPIEL_MITARBEITER[idx]['daten']
+    parameter = daten.copy()
+    if SCHEMA:
+        for field in SCHEMA['input_fields']:
+            if field['id'] in daten:
+                wert = daten[field['id']]
+                if field['type'] == 'number':
+                    # Zahlen immer als float ablegen, dann entfällt float() beim Rendern
+                    wert = parameter[field['id']] = float(wert)
+                st.session_state[field['_key_widget']] = wert
+            else:
+                st.session_state.pop(field['_key_widget'], None)
+        # Editoren/Häkchen der Berechnungen gehören zum vorigen Mitarbeiter
+        for calc in SCHEMA['calculated_fields']:
+            st.session_state.pop(calc['_key_input'], None)
+            st.session_state.pop(calc['_key_btn'], None)
+    st.session_state.parameter = parameter
+
+
+def _bestaetigungen_uebernehmen(ma_id, calcs):
+    """Beim Absenden des Berechnungsformulars angehakte Formeln als geprüft zählen"""
+    zaehler = st.session_state.formel_bestaetigung
+    ma_row = st.session_state.ma_bestaetigt.setdefault(ma_id, {})
+    for calc in calcs:
+        if st.session_state.get(calc['_key_btn']):
+            zaehler[calc['id']] = zaehler.get(calc['id'], 0) + 1
+            ma_row[calc['id']] = True
+
+
+# ============================================================
+# EINGABE-RENDERER (je Feldtyp, liefern den neuen Wert)
+# ============================================================
+
+def _feld_label(field):
+    return f"{field['label']} {'*' if field.get('required') else ''}"
+
+
+def _startwert(field, wert):
+    """value= nur übergeben, solange der Widget-Key noch keinen Zustand hat"""
+    if field['_key_widget'] in st.session_state:
+        return {}
+    return {'value': wert}
+
+
+def _render_text(field, params):
+    return st.text_input(_feld_label(field), **_startwert(field, params.get(field['id'], '')),
+                         help=field.get('hint'), key=field['_key_widget'])
+
+
+def _render_number(field, params):
+    return st.number_input(_feld_label(field), **_startwert(field, params.get(field['id'], 0.0)),
+                           min_value=field['_min_value'], step=0.01,
+                           help=field.get('hint'), key=field['_key_widget'])
+
+
+def _render_date(field, params):
+    current = params.get(field['id'])
+    return st.date_input(_feld_label(field), **_startwert(field, current if isinstance(current, date) else None),
+                         help=field.get('hint'), key=field['_key_widget'])
+
+
+_RENDERERS = {
+    'text': _render_text,
+    'number': _render_number,
+    'date': _render_date,
+}
+
+
+# Session State
+st.session_state.setdefault('parameter', {})
+st.session_state.setdefault('formel_bestaetigung', {})
+st.session_state.setdefault('ma_bestaetigt', {})
 
 # ============================================================
 # HEADER
@@ -164,27 +325,17 @@ with tab2:
     
     if SCHEMA:
         subtab1, subtab2, subtab3 = st.tabs(["Input Fields", "Calculated Fields", "Workflow"])
+        inputs_rows, calcs_rows, workflow_rows = schema_tables()
         
+        # Je Subtab eine Tabelle statt einem Expander pro Feld
         with subtab1:
-            for field in SCHEMA['input_fields']:
-                with st.expander(f"{field['label']} ({field['id']})"):
-                    st.write(f"**Typ:** {field['type']}")
-                    st.write(f"**Gruppe:** {field['group']}")
-                    if field.get('hint'):
-                        st.info(field['hint'])
+            st.dataframe(inputs_rows, hide_index=True)
         
         with subtab2:
-            for calc in SCHEMA['calculated_fields']:
-                with st.expander(f"{calc['label']}"):
-                    st.code(calc['formel'])
-                    st.write(f"**Benötigt:** {', '.join(calc['requires'])}")
-                    st.write(f"**Einheit:** {calc['einheit']}")
+            st.dataframe(calcs_rows, hide_index=True)
         
         with subtab3:
-            for step in SCHEMA['workflow']['steps']:
-                st.markdown(f"**{step['order']}. {step['title']}**")
-                if step.get('description'):
-                    st.caption(step['description'])
+            st.dataframe(workflow_rows, hide_index=True)
 
 # TAB 3: BERECHNUNG
 with tab3:
@@ -194,73 +345,55 @@ with tab3:
     with st.expander("📝 Schritt 1: Eingabedaten", expanded=True):
         # Datenimport
         st.subheader("Datenimport")
-        cols = st.columns(len(BEISPIEL_MITARBEITER))
-        for idx, person in enumerate(BEISPIEL_MITARBEITER):
+        cols = st.columns(len(_BEISPIEL_SUMMARY))
+        for idx, (name, beschreibung) in enumerate(_BEISPIEL_SUMMARY):
             with cols[idx]:
-                st.write(f"**{person['name']}**")
-                st.caption(person['beschreibung'])
-                if st.button("Laden", key=f"load_{idx}"):
-                    st.session_state.parameter = person['daten'].copy()
-                    st.rerun()
+                st.write(f"**{name}**")
+                st.caption(beschreibung)
+                st.button("Laden", key=_LADEN_KEYS[idx], on_click=_beispiel_laden, args=(idx,))
         
         st.divider()
         
         # Felder
         if SCHEMA:
-            groups = {}
-            for field in SCHEMA['input_fields']:
-                g = field['group']
-                if g not in groups:
-                    groups[g] = []
-                groups[g].append(field)
+            groups = grouped_inputs()
             
             labels = {'identifikation': 'Identifikation', 'stammdaten': 'Stammdaten', 'gehalt': 'Gehaltsdaten'}
             
+            # Conditional: auszublendende Felder einmal vorab bestimmen
+            parameter = st.session_state.parameter
+            eintritt = parameter.get('eintrittsdatum')
+            vor_stichtag = isinstance(eintritt, date) and eintritt < config.stichtag
+            hidden = {
+                field['id'] for field in SCHEMA['input_fields']
+                if (field.get('depends_on') and not parameter.get(field['depends_on']))
+                or (field.get('show_when') and field['id'] == 'letztes_gehalt' and vor_stichtag)
+            }
+            
             for group_name, fields in groups.items():
                 st.subheader(labels.get(group_name, group_name))
                 
                 for field in fields:
-                    # Conditional
-                    if field.get('depends_on') and not st.session_state.parameter.get(field['depends_on']):
+                    if field['id'] in hidden:
                         continue
                     
-                    if field.get('show_when'):
-                        eintritt = st.session_state.parameter.get('eintrittsdatum')
-                        if eintritt and isinstance(eintritt, date):
-                            if field['id'] == 'letztes_gehalt' and eintritt < config.stichtag:
-                                continue
-                    
                     # Render
-                    label = f"{field['label']} {'*' if field.get('required') else ''}"
-                    
-                    if field['type'] == 'text':
-                        val = st.text_input(label, value=st.session_state.parameter.get(field['id'], ''), 
-                                          help=field.get('hint'), key=f"f_{field['id']}")
-                        st.session_state.parameter[field['id']] = val
-                    
-                    elif field['type'] == 'number':
-                        val = st.number_input(label, value=float(st.session_state.parameter.get(field['id'], 0)), 
-                                            min_value=field.get('min_value', 0.0), step=0.01,
-                                            help=field.get('hint'), key=f"f_{field['id']}")
-                        st.session_state.parameter[field['id']] = val
-                    
-                    elif field['type'] == 'date':
-                        current = st.session_state.parameter.get(field['id'])
-                        val = st.date_input(label, value=current if isinstance(current, date) else None,
-                                          help=field.get('hint'), key=f"f_{field['id']}")
-                        st.session_state.parameter[field['id']] = val
+                    render = _RENDERERS.get(field['type'])
+                    if render is not None:
+                        parameter[field['id']] = render(field, parameter)
+    
+    # Eingaben einmal lesen (params ist dasselbe Dict wie st.session_state.parameter)
+    params = st.session_state.parameter
+    geb = params.get('geburtsdatum')
+    ein = params.get('eintrittsdatum')
+    aus = params.get('austrittsdatum')
+    ist_alt = ein is not None and ein < config.stichtag
     
     # SCHRITT 2: UNVERZALLBARKEIT
-    if all([st.session_state.parameter.get('austrittsdatum'),
-            st.session_state.parameter.get('geburtsdatum'),
-            st.session_state.parameter.get('eintrittsdatum')]):
+    if aus and geb and ein:
         
         with st.expander("⚖️ Schritt 2: Unverzallbarkeitsprüfung", expanded=True):
-            ist_unverfallbar, grund = berechnung.unverfallbarkeit_pruefung(
-                st.session_state.parameter['geburtsdatum'],
-                st.session_state.parameter['eintrittsdatum'],
-                st.session_state.parameter['austrittsdatum']
-            )
+            ist_unverfallbar, grund = pruefe_unverfallbarkeit(_ordinal(geb), _ordinal(ein), _ordinal(aus))
             
             if ist_unverfallbar:
                 st.success(f"✓ **Unverfallbarkeit erfüllt**")
@@ -271,52 +404,55 @@ with tab3:
                 st.warning("⚠️ Kein Anspruch - weitere Berechnungen entfallen")
                 st.stop()
     
+    # Zwischenwerte (Rentenbeginn, Dienstzeit, m/n) einmal pro Mitarbeiter
+    kontext = None
+    if geb and ein:
+        kontext = compute_all(_ordinal(geb), _ordinal(ein), _ordinal(aus))
+    
     # SCHRITT 3: BERECHNUNGEN
-    if all([st.session_state.parameter.get('geburtsdatum'),
-            st.session_state.parameter.get('eintrittsdatum')]):
+    # Expander nur, wenn mindestens eine Berechnung ihre Eingaben hat
+    filled_keys = {k for k, v in params.items() if v}
+    any_calc_ready = kontext is not None and bool(SCHEMA) and any(
+        calc['_req_set'] <= filled_keys for calc in SCHEMA['calculated_fields']
+    )
+    if any_calc_ready:
         
         with st.expander("🧮 Schritt 3: Berechnete Leistung", expanded=True):
-            if SCHEMA:
+            # Einmal pro Rerun: Dienstzeit und m/n aus dem (gecachten) Kontext
+            dienstjahre = kontext.dienstjahre
+            mn_prozent = kontext.mn_prozent
+            gehalt = params.get('letztes_gehalt', 0)
+            ma_id = f"{geb}_{ein}"
+            ma_row = st.session_state.ma_bestaetigt.setdefault(ma_id, {})
+            
+            # Ein Formular: Änderungen und Häkchen lösen erst beim Absenden einen Rerun aus
+            zu_bestaetigen = []
+            with st.form("calc_form"):
                 for calc in SCHEMA['calculated_fields']:
                     # Requirements check
-                    if not all(st.session_state.parameter.get(r) for r in calc['requires']):
+                    if not calc['_req_set'] <= filled_keys:
                         continue
                     
                     # Berechne
                     wert = 0
                     
                     if calc['id'] == 'dienstzeit':
-                        wert = berechnung.betriebszugehoerigkeit_jahre(
-                            st.session_state.parameter['eintrittsdatum'],
-                            st.session_state.parameter['geburtsdatum']
-                        )
+                        wert = dienstjahre
                     
                     elif calc['id'] == 'mn_faktor':
-                        if st.session_state.parameter.get('austrittsdatum'):
-                            f, m, n = berechnung.mn_faktor(
-                                st.session_state.parameter['eintrittsdatum'],
-                                st.session_state.parameter['austrittsdatum'],
-                                st.session_state.parameter['geburtsdatum']
-                            )
-                            wert = round(f * 100, 2)
+                        if mn_prozent is not None:
+                            wert = round(mn_prozent, 2)
                     
                     elif calc['id'] in ['grundrente_alt', 'grundrente_neu']:
-                        ist_alt = st.session_state.parameter['eintrittsdatum'] < config.stichtag
-                        
                         if (calc['id'] == 'grundrente_alt' and not ist_alt) or \
                            (calc['id'] == 'grundrente_neu' and ist_alt):
                             continue
                         
-                        bzg = st.session_state.parameter.get('dienstzeit_berechnet', 
-                            berechnung.betriebszugehoerigkeit_jahre(
-                                st.session_state.parameter['eintrittsdatum'],
-                                st.session_state.parameter['geburtsdatum']))
+                        bzg = params.get('dienstzeit_berechnet', dienstjahre)
                         
                         if isinstance(bzg, str):
                             bzg = float(bzg)
                         
-                        gehalt = st.session_state.parameter.get('letztes_gehalt', 0)
-                        
                         if calc['id'] == 'grundrente_alt':
                             wert = bzg * config.alt_betrag_pro_jahr
                         else:
@@ -324,14 +460,10 @@ with tab3:
                             wert = gehalt * satz
                         
                         # m/n
-                        if st.session_state.parameter.get('austrittsdatum'):
-                            mn = st.session_state.parameter.get('mn_faktor_berechnet')
+                        if mn_prozent is not None:
+                            mn = params.get('mn_faktor_berechnet')
                             if mn is None:
-                                f, m, n = berechnung.mn_faktor(
-                                    st.session_state.parameter['eintrittsdatum'],
-                                    st.session_state.parameter['austrittsdatum'],
-                                    st.session_state.parameter['geburtsdatum'])
-                                mn = f * 100
+                                mn = mn_prozent
                             wert = wert * (float(mn) / 100)
                         
                         wert = round(wert, 2)
@@ -343,11 +475,13 @@ with tab3:
                     col1, col2 = st.columns([3, 1])
                     with col1:
                         field_id = f"{calc['id']}_berechnet"
-                        current = st.session_state.parameter.get(field_id, wert)
+                        current = params.get(field_id)
+                        if current is None:
+                            current = float(wert)
                         if calc.get('editable', True):
-                            val = st.number_input(f"Wert ({calc['einheit']})", value=float(current), 
-                                                step=0.01, key=f"c_{calc['id']}")
-                            st.session_state.parameter[field_id] = val
+                            val = st.number_input(f"Wert ({calc['einheit']})", value=current,
+                                                step=0.01, key=calc['_key_input'])
+                            params[field_id] = val
                         else:
                             st.metric("", f"{wert} {calc['einheit']}")
                     
@@ -361,26 +495,22 @@ with tab3:
                         elif calc.get('needs_confirmation', True):
                             st.warning(f"{bestaetigt}/{threshold}")
                             
-                            ma_id = f"{st.session_state.parameter.get('geburtsdatum')}_{st.session_state.parameter.get('eintrittsdatum')}"
-                            ma_geprueft = st.session_state.ma_bestaetigt.get(ma_id, {}).get(calc['id'], False)
+                            ma_geprueft = ma_row.get(calc['id'], False)
                             
                             if not ma_geprueft and bestaetigt < threshold:
-                                if st.button("✓", key=f"btn_{calc['id']}"):
-                                    st.session_state.formel_bestaetigung[calc['id']] = bestaetigt + 1
-                                    if ma_id not in st.session_state.ma_bestaetigt:
-                                        st.session_state.ma_bestaetigt[ma_id] = {}
-                                    st.session_state.ma_bestaetigt[ma_id][calc['id']] = True
-                                    st.rerun()
+                                st.checkbox("✓", key=calc['_key_btn'])
+                                zu_bestaetigen.append(calc)
                     
                     st.caption(f"Berechnet: {wert} {calc['einheit']}")
                     st.divider()
+                
+                st.form_submit_button("Übernehmen", on_click=_bestaetigungen_uebernehmen,
+                                      args=(ma_id, zu_bestaetigen))
     
     # SCHRITT 4: ÜBERSICHT
-    if st.session_state.parameter.get('geburtsdatum') and st.session_state.parameter.get('eintrittsdatum'):
+    if kontext is not None:
         with st.expander("📋 Schritt 4: Gesamtübersicht", expanded=True):
-            ist_alt = st.session_state.parameter['eintrittsdatum'] < config.stichtag
-            
-            rente = st.session_state.parameter.get('grundrente_alt_berechnet' if ist_alt else 'grundrente_neu_berechnet')
+            rente = params.get('grundrente_alt_berechnet' if ist_alt else 'grundrente_neu_berechnet')
             
             if rente:
                 rente = float(rente)
@@ -389,8 +519,7 @@ with tab3:
                 with col1:
                     st.metric("Monatliche Rente", f"{rente:.2f} €")
                 with col2:
-                    rentenbeginn = berechnung.rentenbeginn(st.session_state.parameter['geburtsdatum'])
-                    st.metric("Rentenbeginn", rentenbeginn)
+                    st.metric("Rentenbeginn", kontext.rentenbeginn)
                 with col3:
                     if config.kapital_wahlrecht and rente < config.kapital_bagatellgrenze:
                         st.metric("Kapitalabfindung", f"{rente * config.kapital_faktor:.2f} €")
@@ -413,11 +542,6 @@ with tab3:
 
 # FOOTER
 st.divider()
-col1, col2, col3 = st.columns(3)
 if SCHEMA:
-    with col1:
-        st.caption(f"📊 {len(SCHEMA['input_fields'])} Input Fields")
-    with col2:
-        st.caption(f"🧮 {len(SCHEMA['calculated_fields'])} Calculated Fields")
-    with col3:
-        st.caption(f"🔄 {len(SCHEMA['workflow']['steps'])} Workflow Steps")
+    n_in, n_calc, n_wf = schema_counts()
+    st.caption(f"📊 {n_in} Input Fields · 🧮 {n_calc} Calculated Fields · 🔄 {n_wf} Workflow Steps")